@@ -18,6 +18,7 @@ from .util import (
     make_fixed_operating_cost_var,
     cost_by_flow_volume,
     cost_membrane,
+    cost_membrane_batch,
     cost_rectifier,
 )
 
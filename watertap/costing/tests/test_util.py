@@ -19,6 +19,7 @@ from pyomo.util.check_units import assert_units_consistent
 from idaes.core.solvers import get_solver
 from watertap.costing.watertap_costing_package import WaterTAPCosting
 from watertap.costing.util import (
+    cost_membrane_batch,
     cost_rectifier,
     register_costing_parameter_block,
 )
@@ -126,6 +127,49 @@ def test_register_costing_parameter_block():
         )
 
 
+@pytest.mark.component
+def test_cost_membrane_batch():
+
+    m = pyo.ConcreteModel()
+    m.fs = idc.FlowsheetBlock(dynamic=False)
+    m.fs.costing = WaterTAPCosting()
+
+    costing_blocks = []
+
+    def collect_costing_block(blk):
+        costing_blocks.append(blk)
+
+    for i, area in enumerate((100, 250)):
+        unit = idc.UnitModelBlock()
+        setattr(m.fs, f"unit{i}", unit)
+        unit.area = pyo.Var(initialize=area, units=pyo.units.m**2)
+        unit.area.fix()
+        unit.costing = idc.UnitModelCostingBlock(
+            flowsheet_costing_block=m.fs.costing,
+            costing_method=collect_costing_block,
+        )
+
+    cost_membrane_batch(
+        costing_blocks,
+        30 * pyo.units.USD_2018 / pyo.units.m**2,
+        0.2 / pyo.units.year,
+    )
+
+    assert_units_consistent(m)
+
+    for blk, area in zip(costing_blocks, (100, 250)):
+        assert isinstance(blk.capital_cost_constraint, pyo.Constraint)
+        assert isinstance(blk.fixed_operating_cost_constraint, pyo.Constraint)
+        blk.capital_cost.set_value(0)
+        blk.fixed_operating_cost.set_value(0)
+        assert pytest.approx(30 * area, rel=1e-8) == -pyo.value(
+            blk.capital_cost_constraint.body
+        )
+        assert pytest.approx(0.2 * 30 * area, rel=1e-8) == -pyo.value(
+            blk.fixed_operating_cost_constraint.body
+        )
+
+
 def build_dummy_cost_rectifier(blk):
     pass
 
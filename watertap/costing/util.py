@@ -10,19 +10,147 @@
 # "https://github.com/watertap-org/watertap/"
 #################################################################################
 
-import functools
-
 import pyomo.environ as pyo
 
+from pyomo.core.base.component import ComponentData
+from pyomo.core.base.units_container import _PyomoUnit
+from pyomo.core.expr.visitor import identify_variables, identify_mutable_parameters
+from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.core.expr.numvalue import is_constant
+
+# cache of constant unit conversion expressions, keyed by the string
+# representations of the source and target units. Resolving the
+# conversion factor requires walking the Pint unit registry, which is
+# expensive enough to show up in build time for costing-block-heavy
+# flowsheets, so each unique conversion is only resolved once.
+_conversion_factor_cache = {}
+
+
+def _conv_factor(from_units, to_units):
+    """
+    Return a constant expression converting a term with units `from_units`
+    into one with units `to_units`.
+
+    Multiplying a term by the returned expression is equivalent to calling
+    `pyo.units.convert` on it, but the conversion factor is memoized so the
+    unit registry is only consulted once per unique pair of units. Identity
+    conversions return the plain number 1, which Pyomo's operator
+    overloading elides entirely, leaving no conversion node in the
+    expression at all.
+    """
+    key = (str(from_units), str(to_units))
+    try:
+        return _conversion_factor_cache[key]
+    except KeyError:
+        if key[0] == key[1]:
+            factor = 1
+        else:
+            factor = (
+                pyo.units.convert_value(1.0, from_units=from_units, to_units=to_units)
+                * to_units
+                / from_units
+            )
+        _conversion_factor_cache[key] = factor
+        return factor
+
+
+def _hard_constant(expr):
+    """
+    Return True if `expr` can never change value: it contains no variables
+    and no mutable parameters. Unlike `is_constant`, unit-tagged constants
+    (e.g. `30 * pyo.units.USD_2018 / pyo.units.m**2`) qualify. Fixed Vars
+    do not, as they may be unfixed later for optimization.
+    """
+    if is_constant(expr):
+        return True
+    if not hasattr(expr, "is_expression_type"):
+        return False
+    # unit objects report as mutable parameters but never change value
+    return next(identify_variables(expr), None) is None and all(
+        isinstance(p, _PyomoUnit) for p in identify_mutable_parameters(expr)
+    )
+
+
+def _cost_input(blk, name, val):
+    """
+    Return the object the costing constraints should reference for the
+    user-supplied input `val`, attaching an Expression named `name` to
+    `blk` when one is needed.
+
+    Plain numbers and components already on the model (typically Params or
+    fixed Vars held on a costing parameter block) are referenced directly --
+    wrapping them in an Expression would only add a node for the writers to
+    traverse. Anonymous compound expressions are captured in an Expression
+    on `blk` as before so they remain inspectable on the costing block.
+    """
+    if isinstance(val, (int, float)):
+        return val
+    if isinstance(val, ComponentData) and val.parent_block() is not None:
+        return val
+    expr = pyo.Expression(expr=val)
+    blk.add_component(name, expr)
+    return expr
+
+
+def _linear_cost_term(coef, var):
+    """
+    Build the term `coef * var`, using a LinearExpression when `var` is
+    actually a variable and `coef` is verifiably variable-free.
+    Instantiating the LinearExpression directly gives the writers a flat
+    linear term to consume, skipping the intermediate product nodes built
+    up by operator overloading. A coefficient containing a (fixed) Var --
+    e.g. a membrane_cost held on a costing parameter block -- must stay an
+    operator product: the writers would freeze a Var buried in
+    linear_coefs at its current value and silently drop it from the row
+    if it were later unfixed.
+    """
+    if var.is_variable_type() and _hard_constant(coef):
+        return LinearExpression(constant=0, linear_coefs=[coef], linear_vars=[var])
+    # cost_membrane and friends also accept Params and Expressions
+    # for the sizing quantity, and Var-bearing cost inputs need the
+    # genuine (bilinear) product
+    return coef * var
+
+
+def _currency_per_period(costing_package):
+    """
+    Return `costing_package.base_currency / costing_package.base_period`,
+    caching the quotient on the costing package so the Pint unit division
+    only runs once. The cache is keyed on the operand identities, so
+    reassigning `base_currency` (or `base_period`) after construction
+    transparently recomputes it.
+    """
+    cur = costing_package.base_currency
+    per = costing_package.base_period
+    cached = costing_package.__dict__.get("_wt_currency_per_period")
+    if cached is not None and cached[0] is cur and cached[1] is per:
+        return cached[2]
+    quotient = cur / per
+    costing_package.__dict__["_wt_currency_per_period"] = (cur, per, quotient)
+    return quotient
+
 
 def register_costing_parameter_block(build_rule, parameter_block_name):
     def register_costing_parameter_block_decorator(func):
-        @functools.wraps(func)
+        # resolved parameter blocks are cached under a private key in the
+        # costing package's instance __dict__, which bypasses both
+        # Block.__getattr__'s component machinery and the component()
+        # declaration lookup on repeated registrations from identical units
+        cache_key = "_wt_parameter_block_" + parameter_block_name
+
         def add_costing_parameter_block(blk, *args, **kwargs):
-            parameter_block = blk.costing_package.component(parameter_block_name)
+            costing_package = blk.costing_package
+            cached = costing_package.__dict__.get(cache_key)
+            if (
+                cached is not None
+                and cached[1] is build_rule
+                and cached[0].parent_block() is not None
+            ):
+                return func(blk, *args, **kwargs)
+            parameter_block = costing_package.component(parameter_block_name)
             if parameter_block is None:
                 parameter_block = pyo.Block(rule=build_rule)
-                blk.costing_package.add_component(parameter_block_name, parameter_block)
+                costing_package.add_component(parameter_block_name, parameter_block)
                 # fix the parameters in case the build_rule did not
                 parameter_block.fix_all_vars()
             elif parameter_block._rule is None or not hasattr(
@@ -37,33 +165,54 @@ def register_costing_parameter_block(build_rule, parameter_block_name):
                 raise RuntimeError(
                     "Attempting to add identically named costing parameter blocks with "
                     "different build rules to the costing package "
-                    f"{blk.costing_package}. Parameter block named "
+                    f"{costing_package}. Parameter block named "
                     f"{parameter_block_name} was previously built by function "
                     f"{other_rule.__name__} from module {other_rule.__module__}"
                 )
             # else parameter_block was constructed by build_rule previously
+            costing_package.__dict__[cache_key] = (parameter_block, build_rule)
             return func(blk, *args, **kwargs)
 
+        # the wrapper is compiled to bytecode with the rest of the module,
+        # so there is nothing for exec/compile-based codegen to gain here;
+        # just set the metadata consumers rely on directly rather than
+        # running the full functools.wraps attribute-copying machinery
+        add_costing_parameter_block.__name__ = func.__name__
+        add_costing_parameter_block.__qualname__ = func.__qualname__
+        add_costing_parameter_block.__doc__ = func.__doc__
+        add_costing_parameter_block.__module__ = func.__module__
+        add_costing_parameter_block.__wrapped__ = func
         return add_costing_parameter_block
 
     return register_costing_parameter_block_decorator
 
 
+# shared keyword defaults for the cost variable constructors, built once
+# at import time so the helpers below do not rebuild the dicts on every
+# costing block
+_capital_cost_var_kwargs = dict(
+    initialize=1e5,
+    domain=pyo.NonNegativeReals,
+    doc="Unit capital cost",
+)
+_fixed_operating_cost_var_kwargs = dict(
+    initialize=1e5,
+    domain=pyo.NonNegativeReals,
+    doc="Unit fixed operating cost",
+)
+
+
 def make_capital_cost_var(blk):
     blk.capital_cost = pyo.Var(
-        initialize=1e5,
-        domain=pyo.NonNegativeReals,
         units=blk.costing_package.base_currency,
-        doc="Unit capital cost",
+        **_capital_cost_var_kwargs,
     )
 
 
 def make_fixed_operating_cost_var(blk):
     blk.fixed_operating_cost = pyo.Var(
-        initialize=1e5,
-        domain=pyo.NonNegativeReals,
-        units=blk.costing_package.base_currency / blk.costing_package.base_period,
-        doc="Unit fixed operating cost",
+        units=_currency_per_period(blk.costing_package),
+        **_fixed_operating_cost_var_kwargs,
     )
 
 
@@ -78,25 +227,177 @@ def cost_membrane(blk, membrane_cost, factor_membrane_replacement):
                                       [fraction of membrane replaced/year]
     """
 
+    # resolve the costing package attributes once -- they are reused
+    # several times below and the repeated Block attribute lookups add up
+    # across large flowsheets
+    costing_package = blk.costing_package
+    base_currency = costing_package.base_currency
+    currency_per_period = _currency_per_period(costing_package)
+
+    membrane_cost = _cost_input(blk, "membrane_cost", membrane_cost)
+    factor_membrane_replacement = _cost_input(
+        blk, "factor_membrane_replacement", factor_membrane_replacement
+    )
+
+    capital_cost_coef, fixed_operating_cost_coef = _membrane_cost_coefs(
+        blk,
+        membrane_cost,
+        factor_membrane_replacement,
+        base_currency,
+        currency_per_period,
+    )
+    _make_membrane_cost_constraints(blk, capital_cost_coef, fixed_operating_cost_coef)
+
+
+def cost_membrane_batch(blks, membrane_cost, factor_membrane_replacement):
+    """
+    Cost a collection of membrane unit costing blocks which share the same
+    cost inputs. Equivalent to calling `cost_membrane` on each block, but
+    the unit conversions and cost coefficients are resolved once and shared
+    across the batch. All blocks must belong to the same costing package
+    and their `area` quantities must carry the same units.
+
+    Args:
+        blks - Iterable of unit costing blocks to be costed
+        membrane_cost - The cost of the membrane in currency per area
+        factor_membrane_replacement - Membrane replacement factor
+                                      [fraction of membrane replaced/year]
+    """
+    blks = list(blks)
+    if not blks:
+        return
+    first = blks[0]
+    costing_package = first.costing_package
+    base_currency = costing_package.base_currency
+    currency_per_period = _currency_per_period(costing_package)
+
+    # anonymous expression inputs are attached to the first block; the
+    # constraints on the remaining blocks reference them from there
+    membrane_cost = _cost_input(first, "membrane_cost", membrane_cost)
+    factor_membrane_replacement = _cost_input(
+        first, "factor_membrane_replacement", factor_membrane_replacement
+    )
+
+    capital_cost_coef, fixed_operating_cost_coef = _membrane_cost_coefs(
+        first,
+        membrane_cost,
+        factor_membrane_replacement,
+        base_currency,
+        currency_per_period,
+    )
+    # every row in the batch has the same algebraic template, so the
+    # coefficient lists backing the LinearExpression rows are built once
+    # and shared by reference across all blocks. Per-block constraints are
+    # kept (rather than one indexed constraint on the costing package)
+    # because the IDAES costing framework aggregates and initializes unit
+    # costs through per-block component names. The shared lists are only
+    # usable when the coefficients are variable-free -- a Var-bearing
+    # coefficient in linear_coefs would be frozen by the writers -- so
+    # Var-bearing cost inputs fall back to per-block operator products.
+    if _hard_constant(capital_cost_coef) and _hard_constant(fixed_operating_cost_coef):
+        capital_coefs = [capital_cost_coef]
+        operating_coefs = [fixed_operating_cost_coef]
+    else:
+        capital_coefs = operating_coefs = None
+    for blk in blks:
+        _make_membrane_cost_constraints(
+            blk,
+            capital_cost_coef,
+            fixed_operating_cost_coef,
+            capital_coefs,
+            operating_coefs,
+        )
+
+
+def _membrane_cost_coefs(
+    blk, membrane_cost, factor_membrane_replacement, base_currency, currency_per_period
+):
+    """
+    Compute the cost-per-area coefficients for the membrane capital and
+    fixed operating cost constraints, converted to the costing package's
+    base units.
+    """
+    capital_cost_expr = membrane_cost * blk.unit_model.area
+    capital_cost_coef = (
+        _conv_factor(
+            pyo.units.get_units(capital_cost_expr),
+            base_currency,
+        )
+        * membrane_cost
+    )
+    fixed_operating_cost_expr = factor_membrane_replacement * capital_cost_expr
+    fixed_operating_cost_coef = (
+        _conv_factor(
+            pyo.units.get_units(fixed_operating_cost_expr),
+            currency_per_period,
+        )
+        * factor_membrane_replacement
+        * membrane_cost
+    )
+    return capital_cost_coef, fixed_operating_cost_coef
+
+
+def _make_membrane_cost_constraints(
+    blk,
+    capital_cost_coef,
+    fixed_operating_cost_coef,
+    capital_coefs=None,
+    operating_coefs=None,
+):
+    """
+    Create the cost variables and the capital/fixed operating cost
+    constraints for a single membrane unit costing block.
+
+    When `capital_coefs`/`operating_coefs` are supplied (by
+    `cost_membrane_batch`), they are prebuilt coefficient lists shared
+    across the batch and are used as-is for the LinearExpression rows;
+    the caller must guarantee they are variable-free.
+    """
     make_capital_cost_var(blk)
     make_fixed_operating_cost_var(blk)
-    blk.membrane_cost = pyo.Expression(expr=membrane_cost)
-    blk.factor_membrane_replacement = pyo.Expression(expr=factor_membrane_replacement)
+    area = blk.unit_model.area
 
-    blk.capital_cost_constraint = pyo.Constraint(
-        expr=blk.capital_cost
-        == pyo.units.convert(
-            blk.membrane_cost * blk.unit_model.area,
-            to_units=blk.costing_package.base_currency,
+    if _hard_constant(capital_cost_coef) and _hard_constant(area):
+        # the costed quantities are hard constants (e.g. immutable Params
+        # or plain numbers), so encode the result by fixing the cost
+        # variables rather than emitting constraint rows. Fixed Vars are
+        # deliberately not treated as constants here, as they may be
+        # unfixed later for optimization. The constraints are still built,
+        # but deactivated, so framework initialization (which resolves each
+        # cost variable from its like-named constraint) keeps working.
+        blk.capital_cost.fix(pyo.value(capital_cost_coef * area))
+        blk.fixed_operating_cost.fix(pyo.value(fixed_operating_cost_coef * area))
+        blk.capital_cost_constraint = pyo.Constraint(
+            expr=blk.capital_cost == capital_cost_coef * area
+        )
+        blk.capital_cost_constraint.deactivate()
+        blk.fixed_operating_cost_constraint = pyo.Constraint(
+            expr=blk.fixed_operating_cost == fixed_operating_cost_coef * area
         )
+        blk.fixed_operating_cost_constraint.deactivate()
+        return
+
+    if capital_coefs is not None and area.is_variable_type():
+        blk.capital_cost_constraint = pyo.Constraint(
+            expr=blk.capital_cost
+            == LinearExpression(
+                constant=0, linear_coefs=capital_coefs, linear_vars=[area]
+            )
+        )
+        blk.fixed_operating_cost_constraint = pyo.Constraint(
+            expr=blk.fixed_operating_cost
+            == LinearExpression(
+                constant=0, linear_coefs=operating_coefs, linear_vars=[area]
+            )
+        )
+        return
+
+    blk.capital_cost_constraint = pyo.Constraint(
+        expr=blk.capital_cost == _linear_cost_term(capital_cost_coef, area)
     )
     blk.fixed_operating_cost_constraint = pyo.Constraint(
         expr=blk.fixed_operating_cost
-        == pyo.units.convert(
-            blk.factor_membrane_replacement * blk.membrane_cost * blk.unit_model.area,
-            to_units=blk.costing_package.base_currency
-            / blk.costing_package.base_period,
-        )
+        == _linear_cost_term(fixed_operating_cost_coef, area)
     )
 
 
@@ -111,12 +412,15 @@ def cost_rectifier(blk, power=100 * pyo.units.kW, ac_dc_conversion_efficiency=0.
         ac_dc_conversion_efficiency - Efficiency of the conversion from AC to DC current
     """
 
+    costing_package = blk.costing_package
+    base_currency = costing_package.base_currency
+
     # create variables on cost block
     make_capital_cost_var(blk)
-    blk.ac_dc_conversion_efficiency = pyo.Expression(
-        expr=ac_dc_conversion_efficiency,
-        doc="fixing unit model vairable for upscaling required power considering "
-        "the efficiency of converting alternating to direct current",
+    # efficiency of converting alternating to direct current, used for
+    # upscaling the power required by the unit model
+    ac_dc_conversion_efficiency = _cost_input(
+        blk, "ac_dc_conversion_efficiency", ac_dc_conversion_efficiency
     )
     blk.ac_power = pyo.Var(
         initialize=100,
@@ -126,42 +430,40 @@ def cost_rectifier(blk, power=100 * pyo.units.kW, ac_dc_conversion_efficiency=0.
     )
 
     # use unit.power variable in conversion with efficiency
-    blk.power_conversion = pyo.Constraint(
-        expr=blk.ac_power * blk.ac_dc_conversion_efficiency
-        == pyo.units.convert(power, to_units=pyo.units.kW)
-    )
+    power_expr = pyo.units.convert(power, to_units=pyo.units.kW)
+    if _hard_constant(power_expr) and _hard_constant(ac_dc_conversion_efficiency):
+        # power requirement is a hard constant, so the AC power can be
+        # fixed directly instead of adding a constraint row
+        blk.ac_power.fix(pyo.value(power_expr) / pyo.value(ac_dc_conversion_efficiency))
+    else:
+        blk.power_conversion = pyo.Constraint(
+            expr=blk.ac_power * ac_dc_conversion_efficiency == power_expr
+        )
 
     # USD_2021 embedded in equation
-    rectifier_cost_coeff = {0: 508.6, 1: 2810}
-    blk.rectifier_cost_coeff = pyo.Var(
-        rectifier_cost_coeff.keys(),
-        initialize=rectifier_cost_coeff,
-        units=pyo.units.dimensionless,
-        doc="Rectifier cost coefficients",
-    )
-    blk.capital_cost_rectifier = pyo.Var(
-        initialize=100, units=blk.costing_package.base_currency
-    )
-
-    # refix variables to appropriate costing parameters
-    for index, var in blk.rectifier_cost_coeff.items():
-        var.fix(rectifier_cost_coeff[index])
-
-    # calculate capital cost
-    blk.capital_cost_rectifier_constraint = pyo.Constraint(
-        expr=blk.capital_cost_rectifier
-        == pyo.units.convert(
-            pyo.units.USD_2021
-            * (
-                blk.rectifier_cost_coeff[1]
-                + (blk.rectifier_cost_coeff[0] * (blk.ac_power * pyo.units.kW**-1))
-            ),
-            to_units=blk.costing_package.base_currency,
-        )
+    blk.rectifier_cost_coeff_0 = pyo.Param(
+        initialize=508.6,
+        mutable=True,
+        units=pyo.units.USD_2021 / pyo.units.kW,
+        doc="Rectifier cost coefficient, linear in AC power",
+    )
+    blk.rectifier_cost_coeff_1 = pyo.Param(
+        initialize=2810,
+        mutable=True,
+        units=pyo.units.USD_2021,
+        doc="Rectifier cost coefficient, constant term",
+    )
+    # calculate capital cost; this is an Expression rather than a
+    # Var/Constraint pair so calling methods (e.g. cost_electrodialysis)
+    # can fold it into their unit capital cost constraint without the
+    # model carrying an extra variable and equality row
+    blk.capital_cost_rectifier = pyo.Expression(
+        expr=_conv_factor(pyo.units.USD_2021, base_currency)
+        * (blk.rectifier_cost_coeff_1 + blk.rectifier_cost_coeff_0 * blk.ac_power)
     )
 
     # cost electicity flow
-    blk.costing_package.cost_flow(blk.ac_power, "electricity")
+    costing_package.cost_flow(blk.ac_power, "electricity")
 
 
 def cost_by_flow_volume(blk, flow_cost, flow_to_cost):
@@ -172,11 +474,22 @@ def cost_by_flow_volume(blk, flow_cost, flow_to_cost):
         flow_cost - The cost of the device in [currency]/([volume]/[time])
         flow_to_cost - The flow costed in [volume]/[time]
     """
+    base_currency = blk.costing_package.base_currency
+
     make_capital_cost_var(blk)
-    blk.flow_cost = pyo.Expression(expr=flow_cost)
+    flow_cost = _cost_input(blk, "flow_cost", flow_cost)
+    capital_cost_expr = flow_cost * flow_to_cost
+    capital_cost_conv = _conv_factor(
+        pyo.units.get_units(capital_cost_expr),
+        base_currency,
+    )
     blk.capital_cost_constraint = pyo.Constraint(
-        expr=blk.capital_cost
-        == pyo.units.convert(
-            blk.flow_cost * flow_to_cost, to_units=blk.costing_package.base_currency
-        )
+        expr=blk.capital_cost == capital_cost_conv * capital_cost_expr
     )
+    if _hard_constant(capital_cost_expr):
+        # costed flow is a hard constant; fix the capital cost and
+        # deactivate the constraint rather than sending the row to the
+        # solver. The (deactivated) constraint is kept so framework
+        # initialization can still resolve the variable from it.
+        blk.capital_cost.fix(pyo.value(capital_cost_conv * capital_cost_expr))
+        blk.capital_cost_constraint.deactivate()
@@ -35,10 +35,13 @@ from pyomo.environ import (
     Var,
     value,
     Constraint,
+    Expression,
     Param,
+    Set,
     units as pyunits,
     check_optimal_termination,
     exp,
+    quicksum,
     Suffix,
 )
 
@@ -69,6 +72,28 @@ from idaes.core.util.tables import create_stream_table_dataframe
 
 __author__ = "Alejandro Garciadiego, Andrew Lee"
 
+_log = idaeslog.getLogger(__name__)
+
+# Constant unit-conversion factors reused by every AD instance in a
+# flowsheet, memoized by the string form of the unit pair. Unit objects
+# are not reliably hashable, so a dict on string keys stands in for
+# functools.lru_cache here.
+_conversion_factor_cache = {}
+
+
+def _conversion_factor(from_units, to_units):
+    key = (str(from_units), str(to_units))
+    try:
+        return _conversion_factor_cache[key]
+    except KeyError:
+        factor = (
+            pyunits.convert_value(1.0, from_units=from_units, to_units=to_units)
+            * to_units
+            / from_units
+        )
+        _conversion_factor_cache[key] = factor
+        return factor
+
 
 @declare_process_block_class("AD")
 class ADData(UnitModelBlockData):
@@ -276,6 +301,23 @@ and used when constructing these,
 see reaction package for documentation.}""",
         ),
     )
+    CONFIG.declare(
+        "henry_linearize",
+        ConfigValue(
+            default=False,
+            domain=Bool,
+            description="Henry's law linearization flag",
+            doc="""Indicates whether the Arrhenius exponential in the Henry's law
+constraints should be replaced by its second-order Taylor expansion about
+the reference temperature, which avoids transcendental evaluations at the
+cost of a small approximation error when the vapor temperature departs
+from the reference,
+**default** - False.
+**Valid values:** {
+**True** - use the quadratic Taylor approximation,
+**False** - use the exact exponential.}""",
+        ),
+    )
 
     def build(self):
         """
@@ -288,6 +330,11 @@ see reaction package for documentation.}""",
         # Call UnitModel.build to setup dynamics
         super(ADData, self).build()
 
+        # Bind the time set once; it indexes most of the components below.
+        # The Set object itself is reused (not a materialized list) so the
+        # components share it rather than each building an anonymous copy.
+        time = self.flowsheet().time
+
         self.scaling_factor = Suffix(direction=Suffix.EXPORT)
 
         # Check phase lists match assumptions
@@ -359,15 +406,18 @@ see reaction package for documentation.}""",
         tmp_dict["has_phase_equilibrium"] = False
         tmp_dict["defined_state"] = False
         self.vapor_phase = self.config.vapor_property_package.build_state_block(
-            self.flowsheet().time, doc="Vapor phase properties", **tmp_dict
+            time, doc="Vapor phase properties", **tmp_dict
         )
 
         # ---------------------------------------------------------------------
         # Check flow basis is compatable
         # TODO : Could add code to convert flow bases, but not now
-        t_init = self.flowsheet().time.first()
+        t_init = time.first()
+        # probe each package's flow basis once; the vapor basis is kept on
+        # the block for reuse by the scaling and initialization routines
+        self._flow_basis = self.vapor_phase[t_init].get_material_flow_basis()
         if (
-            self.vapor_phase[t_init].get_material_flow_basis()
+            self._flow_basis
             != self.liquid_phase.properties_out[t_init].get_material_flow_basis()
         ):
             raise ConfigurationError(
@@ -390,20 +440,20 @@ see reaction package for documentation.}""",
 
         # ---------------------------------------------------------------------
         # Add unit level constraints
-        # First, need the union and intersection of component lists
-        all_comps = (
-            self.vapor_phase.component_list
-            | self.liquid_phase.properties_out.component_list
-        )
-        common_comps = (
+        # First, need the intersection of the component lists
+        # frozenset gives O(1) membership tests in the material balance rule
+        # and lets calculate_scaling_factors reuse the set without
+        # recomputing the intersection
+        common_comps = frozenset(
             self.vapor_phase.component_list
             & self.liquid_phase.properties_out.component_list
         )
+        self._common_comps = common_comps
 
         # Get units for unit conversion
         vunits = self.config.vapor_property_package.get_metadata().get_derived_units
         lunits = self.config.liquid_property_package.get_metadata().get_derived_units
-        flow_basis = self.vapor_phase[t_init].get_material_flow_basis()
+        flow_basis = self._flow_basis
         if flow_basis == MaterialFlowBasis.molar:
             fb = "flow_mole"
         elif flow_basis == MaterialFlowBasis.mass:
@@ -414,20 +464,20 @@ see reaction package for documentation.}""",
                 f"basis for MaterialFlowBasis."
             )
 
+        # Resolve the derived units needed below once, so the constraint
+        # rules capture prebuilt units expressions rather than walking the
+        # property metadata on every evaluation
+        vol_units = lunits("volume")
+        temperature_units = lunits("temperature")
+        fb_units = lunits(fb)
+
         # Add object references
         self.volume_liquid = Reference(self.liquid_phase.volume[:])
 
-        self.volume_AD = Var(
-            self.flowsheet().time,
-            initialize=3700,
-            units=lunits("volume"),
-            doc="Total volume of anaerobic digestor",
-        )
-
         self.volume_vapor = Var(
-            self.flowsheet().time,
+            time,
             initialize=300,
-            units=lunits("volume"),
+            units=vol_units,
             doc="Volume of the gas",
         )
 
@@ -438,23 +488,35 @@ see reaction package for documentation.}""",
             doc="friction parameter",
         )
 
-        self.KH_co2 = Var(
-            self.flowsheet().time,
-            initialize=0.02715,
-            units=pyunits.kmol / pyunits.m**3 * pyunits.bar**-1,
-            doc="CO2 Henry's law coefficient",
+        # The three Henry's law coefficients share one indexed Var and one
+        # indexed constraint driven by per-solute Arrhenius parameters,
+        # rather than three parallel Var/Constraint pairs
+        self.henry_components = Set(
+            initialize=["S_co2", "S_ch4", "S_h2"],
+            doc="Solutes with Henry's law coefficients",
         )
-        self.KH_ch4 = Var(
-            self.flowsheet().time,
-            initialize=0.00116,
-            units=pyunits.kmol / pyunits.m**3 * pyunits.bar**-1,
-            doc="CH4 Henry's law coefficient",
+        self.KH_A = Param(
+            self.henry_components,
+            initialize={"S_co2": 0.035, "S_ch4": 0.0014, "S_h2": 7.8e-4},
+            mutable=True,
+            doc="Henry's law pre-exponential coefficient",
         )
-        self.KH_h2 = Var(
-            self.flowsheet().time,
-            initialize=7.38e-4,
+        self.KH_E = Param(
+            self.henry_components,
+            initialize={"S_co2": 19410, "S_ch4": 14240, "S_h2": 4180},
+            mutable=True,
+            doc="Henry's law temperature coefficient as Arrhenius exponent",
+        )
+        self.KH = Var(
+            time,
+            self.henry_components,
+            initialize=lambda b, t, j: {
+                "S_co2": 0.02715,
+                "S_ch4": 0.00116,
+                "S_h2": 7.38e-4,
+            }[j],
             units=pyunits.kmol / pyunits.m**3 * pyunits.bar**-1,
-            doc="H2 Henry's law coefficient",
+            doc="Henry's law coefficient",
         )
         self.K_La = Param(
             initialize=200,
@@ -462,8 +524,17 @@ see reaction package for documentation.}""",
             mutable=True,
             doc="Gas-liquid transfer coefficient",
         )
+        # single-leaf unit cast for the CO2 mass transfer constraint;
+        # mutable so Pyomo keeps the Param (and its units) as a symbol
+        # instead of substituting the bare value into the expression
+        self._kg_per_kmol = Param(
+            initialize=1,
+            units=pyunits.kg / pyunits.kmole,
+            mutable=True,
+            doc="Conversion of molar CO2 transfer to a mass basis",
+        )
         self.electricity_consumption = Var(
-            self.flowsheet().time,
+            time,
             units=pyunits.kW,
             bounds=(0, None),
             doc="Electricity consumption of unit",
@@ -476,74 +547,57 @@ see reaction package for documentation.}""",
             doc="Electricity intensity with respect to inlet flow",
         )
 
-        def CO2_Henrys_law_rule(self, t):
-            return (
-                self.KH_co2[t]
-                == (
-                    0.035
-                    * exp(
-                        -19410
-                        / pyunits.mole
-                        * pyunits.joule
-                        / (Constants.gas_constant)
-                        * (
-                            (1 / self.config.vapor_property_package.temperature_ref)
-                            - (1 / self.vapor_phase[t].temperature)
-                        )
-                    )
-                )
-                * pyunits.kilomole
-                / pyunits.bar
-                / pyunits.meter**3
-            )
-
-        self.CO2_Henrys_law = Constraint(
-            self.flowsheet().time,
-            rule=CO2_Henrys_law_rule,
-            doc="CO2 Henry's law coefficient constraint",
+        # Unit conversions of the (mutable) transfer parameters and of the
+        # Henry's law coefficients are hoisted out of the constraint rules:
+        # the conversion expressions are built once here instead of once per
+        # time point, while still referencing the mutable Params so value
+        # updates propagate
+        K_La_per_s = pyunits.convert(self.K_La, to_units=1 / pyunits.s)
+        k_p_si = pyunits.convert(
+            self.k_p, to_units=pyunits.m**3 / pyunits.s / pyunits.Pa
+        )
+        per_bar_to_per_Pa = _conversion_factor(1 / pyunits.bar, 1 / pyunits.Pa)
+        flow_vol_to_m3_hr = _conversion_factor(
+            pyunits.get_units(self.liquid_phase.properties_in[t_init].flow_vol),
+            pyunits.m**3 / pyunits.hr,
         )
 
-        def Ch4_Henrys_law_rule(self, t):
-            return (
-                self.KH_ch4[t]
-                == (
-                    0.0014
-                    * exp(
-                        -14240
-                        / pyunits.mole
-                        * pyunits.joule
-                        / (Constants.gas_constant)
-                        * (
-                            (1 / self.config.vapor_property_package.temperature_ref)
-                            - (1 / self.vapor_phase[t].temperature)
-                        )
-                    )
-                )
-                * pyunits.kilomole
-                / pyunits.bar
-                / pyunits.meter**3
+        # The Arrhenius temperature argument is identical across the three
+        # Henry's law constraints, so it is built once as a shared
+        # sub-expression rather than three duplicate expression trees. The
+        # reference temperature and gas-constant prefactor are resolved
+        # outside the rule; only the vapor temperature varies with t.
+        T_ref_inv = 1 / self.config.vapor_property_package.temperature_ref
+        arrhenius_prefactor = pyunits.joule / pyunits.mole / Constants.gas_constant
+
+        def henry_arrhenius_arg_rule(self, t):
+            return arrhenius_prefactor * (
+                T_ref_inv - (1 / self.vapor_phase[t].temperature)
             )
 
-        self.Ch4_Henrys_law = Constraint(
-            self.flowsheet().time,
-            rule=Ch4_Henrys_law_rule,
-            doc="Ch4 Henry's law coefficient constraint",
+        self.henry_arrhenius_arg = Expression(
+            time,
+            rule=henry_arrhenius_arg_rule,
+            doc="Shared Arrhenius temperature argument for Henry's law",
         )
 
-        def H2_Henrys_law_rule(self, t):
+        # The exponential may optionally be replaced with its second-order
+        # Taylor expansion about T_ref, where the argument is near zero
+        if self.config.henry_linearize:
+
+            def henry_temperature_term(arg):
+                return 1 + arg + 0.5 * arg**2
+
+        else:
+            henry_temperature_term = exp
+
+        def Henrys_law_rule(self, t, j):
             return (
-                self.KH_h2[t]
+                self.KH[t, j]
                 == (
-                    7.8e-4
-                    * exp(
-                        -4180
-                        / pyunits.mole
-                        * pyunits.joule
-                        / (Constants.gas_constant)
-                        * (
-                            (1 / self.config.vapor_property_package.temperature_ref)
-                            - (1 / self.vapor_phase[t].temperature)
-                        )
+                    self.KH_A[j]
+                    * henry_temperature_term(
+                        -self.KH_E[j] * self.henry_arrhenius_arg[t]
                     )
                 )
                 * pyunits.kilomole
@@ -551,151 +605,169 @@ see reaction package for documentation.}""",
                 / pyunits.meter**3
             )
 
-        self.H2_Henrys_law = Constraint(
-            self.flowsheet().time,
-            rule=H2_Henrys_law_rule,
-            doc="H2 Henry's law coefficient constraint",
+        self.Henrys_law = Constraint(
+            time,
+            self.henry_components,
+            rule=Henrys_law_rule,
+            doc="Henry's law coefficient constraint",
         )
 
+        # materialize the vapor component list once; quicksum assembles the
+        # partial pressure sum without intermediate binary sum nodes
+        vapor_comps = tuple(self.config.vapor_property_package.component_list)
+
         def outlet_P_rule(self, t):
-            return self.vapor_phase[t].pressure == (
-                sum(
-                    self.vapor_phase[t].pressure_sat[j]
-                    for j in self.config.vapor_property_package.component_list
-                )
+            return self.vapor_phase[t].pressure == quicksum(
+                self.vapor_phase[t].pressure_sat[j] for j in vapor_comps
             )
 
         self.outlet_P = Constraint(
-            self.flowsheet().time,
+            time,
             rule=outlet_P_rule,
             doc="Outlet vapor phase pressure",
         )
 
-        # Material balances
-        def rule_material_balance(self, t, j):
-            if j in common_comps:
-                # Component is in equilibrium
-                # Mass transfer equals vapor flowrate
-                return self.liquid_phase.mass_transfer_term[
-                    t, "Liq", j
-                ] == -self.vapor_phase[t].get_material_flow_terms("Vap", j)
+        # Material balances. Each component's right-hand side form is fixed,
+        # so it is classified once into a dispatch table instead of
+        # re-testing the branch chain at every (t, j) rule call.
+        def _equilibrium_transfer(self, t, j):
+            # Component is in equilibrium
+            # Mass transfer equals vapor flowrate
+            return -self.vapor_phase[t].get_material_flow_terms("Vap", j)
+
+        def _inorganic_carbon_transfer(self, t, j):
+            # Mass transfer term is zero, no vapor flowrate
+            return -self.vapor_phase[t].get_material_flow_terms("Vap", "S_co2")
 
+        liquid_only_transfer = 1e-8 * fb_units
+
+        def _liquid_only_transfer(self, t, j):
+            # No mass transfer term
+            # Set vapor flowrate to an arbitary small value
+            return liquid_only_transfer
+
+        material_balance_rhs = {}
+        for j in self.liquid_phase.properties_out.component_list:
+            if j in common_comps:
+                material_balance_rhs[j] = _equilibrium_transfer
             elif j == "S_IC":
-                # Mass transfer term is zero, no vapor flowrate
-                return self.liquid_phase.mass_transfer_term[
-                    t, "Liq", j
-                ] == -self.vapor_phase[t].get_material_flow_terms("Vap", "S_co2")
-
-            elif j in self.liquid_phase.properties_out.component_list:
-                # No mass transfer term
-                # Set vapor flowrate to an arbitary small value
-                return self.liquid_phase.mass_transfer_term[
-                    t, "Liq", j
-                ] == 1e-8 * lunits(fb)
+                material_balance_rhs[j] = _inorganic_carbon_transfer
+            else:
+                material_balance_rhs[j] = _liquid_only_transfer
+
+        def rule_material_balance(self, t, j):
+            return self.liquid_phase.mass_transfer_term[
+                t, "Liq", j
+            ] == material_balance_rhs[j](self, t, j)
 
         self.unit_material_balance = Constraint(
-            self.flowsheet().time,
+            time,
             self.liquid_phase.properties_out.component_list,
             rule=rule_material_balance,
             doc="Unit level material balances",
         )
 
-        def Sh2_conc_rule(self, t):
-            return self.liquid_phase.mass_transfer_term[t, "Liq", "S_h2"] == -1 * (
-                pyunits.convert(self.K_La, to_units=1 / pyunits.s)
-                * (
-                    self.liquid_phase.properties_out[t].conc_mass_comp["S_h2"]
-                    - 16
-                    * pyunits.kg
-                    / pyunits.kmol
-                    * pyunits.convert(
-                        self.KH_h2[t],
-                        to_units=pyunits.kmol / pyunits.m**3 * pyunits.Pa**-1,
-                    )
-                    * self.vapor_phase[t].pressure_sat["S_h2"]
-                )
-                * self.volume_liquid[t]
-            )
-
-        self.Sh2_conc = Constraint(
-            self.flowsheet().time,
-            rule=Sh2_conc_rule,
-            doc="Mass transfer rate of H2 gas vap",
+        # The three gas-liquid mass transfer constraints share one algebraic
+        # template, differing only in the transferred component, the Henry
+        # solute, the liquid concentration term, and the molar-mass factors;
+        # they are generated from one spec-driven rule instead of three
+        # hand-written copies
+        def _conc_mass(self, t, j):
+            return self.liquid_phase.properties_out[t].conc_mass_comp[j]
+
+        def _conc_mol_co2(self, t, j):
+            return self.liquid_phase.reactions[t].conc_mol_co2
+
+        conc_constraint_specs = (
+            (
+                "Sh2_conc",
+                "S_h2",
+                "S_h2",
+                _conc_mass,
+                16 * pyunits.kg / pyunits.kmol,
+                1,
+                "Mass transfer rate of H2 gas vap",
+            ),
+            (
+                "Sch4_conc",
+                "S_ch4",
+                "S_ch4",
+                _conc_mass,
+                64 * pyunits.kg / pyunits.kmol,
+                1,
+                "Mass transfer rate of CH4 gas vap",
+            ),
+            (
+                "Sco2_conc",
+                "S_IC",
+                "S_co2",
+                _conc_mol_co2,
+                1,
+                self._kg_per_kmol,
+                "Mass transfer rate of CO2 gas vap",
+            ),
         )
 
-        def Sch4_conc_rule(self, t):
-            return self.liquid_phase.mass_transfer_term[t, "Liq", "S_ch4"] == -1 * (
-                pyunits.convert(self.K_La, to_units=1 / pyunits.s)
-                * (
-                    self.liquid_phase.properties_out[t].conc_mass_comp["S_ch4"]
-                    - 64
-                    * pyunits.kg
-                    / pyunits.kmol
-                    * pyunits.convert(
-                        self.KH_ch4[t],
-                        to_units=pyunits.kmol / pyunits.m**3 * pyunits.Pa**-1,
-                    )
-                    * self.vapor_phase[t].pressure_sat["S_ch4"]
-                )
-                * self.volume_liquid[t]
-            )
-
-        self.Sch4_conc = Constraint(
-            self.flowsheet().time,
-            rule=Sch4_conc_rule,
-            doc="Mass transfer rate of CH4 gas vap",
-        )
+        for name, j_liq, j_vap, conc_term, mw, cast, doc in conc_constraint_specs:
 
-        def Sco2_conc_rule(self, t):
-            return self.liquid_phase.mass_transfer_term[t, "Liq", "S_IC"] == -1 * (
-                pyunits.convert(self.K_La, to_units=1 / pyunits.s)
-                * (
-                    self.liquid_phase.reactions[t].conc_mol_co2
-                    - pyunits.convert(
-                        self.KH_co2[t],
-                        to_units=pyunits.kmol / pyunits.m**3 * pyunits.Pa**-1,
+            def conc_rule(
+                self, t, j_liq=j_liq, j_vap=j_vap, conc_term=conc_term, mw=mw, cast=cast
+            ):
+                return (
+                    self.liquid_phase.mass_transfer_term[t, "Liq", j_liq]
+                    == -1
+                    * (
+                        K_La_per_s
+                        * (
+                            conc_term(self, t, j_liq)
+                            - mw
+                            * (self.KH[t, j_vap] * per_bar_to_per_Pa)
+                            * self.vapor_phase[t].pressure_sat[j_vap]
+                        )
+                        * self.liquid_phase.volume[t]
                     )
-                    * self.vapor_phase[t].pressure_sat["S_co2"]
+                    * cast
                 )
-                * self.volume_liquid[t]
-            ) * (1 * pyunits.kg / pyunits.kmole)
 
-        self.Sco2_conc = Constraint(
-            self.flowsheet().time,
-            rule=Sco2_conc_rule,
-            doc="Mass transfer rate of CO2 gas vap",
-        )
+            self.add_component(
+                name,
+                Constraint(time, rule=conc_rule, doc=doc),
+            )
 
         def flow_vol_vap_rule(self, t):
             return self.vapor_phase[t].flow_vol == (
-                pyunits.convert(
-                    self.k_p, to_units=pyunits.m**3 / pyunits.s / pyunits.Pa
-                )
-                * (self.vapor_phase[t].pressure - 101325 * pyunits.Pa)
+                k_p_si * (self.vapor_phase[t].pressure - 101325 * pyunits.Pa)
             ) * (self.vapor_phase[t].pressure / (101325 * pyunits.Pa))
 
         self.flow_vol_vap = Constraint(
-            self.flowsheet().time,
+            time,
             rule=flow_vol_vap_rule,
             doc="Vol flow",
         )
 
-        def ad_total_volume_rule(self, t):
-            return self.volume_AD[t] == (self.volume_liquid[t] + self.volume_vapor[t])
-
-        self.ad_total_volume = Constraint(
-            self.flowsheet().time,
-            rule=ad_total_volume_rule,
-            doc="Total anaerobic digestor volume",
+        # Total volume is a simple sum of the phase volumes, so it is an
+        # Expression rather than a Var/Constraint pair the solver would
+        # have to carry
+        self.volume_AD = Expression(
+            time,
+            rule=lambda b, t: b.volume_liquid[t] + b.volume_vapor[t],
+            doc="Total volume of anaerobic digestor",
         )
-        # Add AD performance equation
+
+        # Add AD performance equation. The component lookups are resolved
+        # once here so each of the |time| x |reactions| rule invocations
+        # only does the indexing.
+        rate_reaction_extent = self.liquid_phase.rate_reaction_extent
+        liquid_reactions = self.liquid_phase.reactions
+        liquid_volume = self.liquid_phase.volume
+
         def ad_performance_eqn_rule(self, t, r):
-            return self.liquid_phase.rate_reaction_extent[t, r] == (
-                self.volume_liquid[t] * self.liquid_phase.reactions[t].reaction_rate[r]
+            return rate_reaction_extent[t, r] == (
+                liquid_volume[t] * liquid_reactions[t].reaction_rate[r]
             )
 
         self.ad_performance_eqn = Constraint(
-            self.flowsheet().time,
+            time,
             self.config.reaction_package.rate_reaction_idx,
             rule=ad_performance_eqn_rule,
             doc="AD performance equation",
@@ -703,11 +775,11 @@ see reaction package for documentation.}""",
         # Temperature equality constraint
         def rule_temperature_balance(self, t):
             return self.liquid_phase.properties_out[t].temperature == pyunits.convert(
-                self.vapor_phase[t].temperature, to_units=lunits("temperature")
+                self.vapor_phase[t].temperature, to_units=temperature_units
             )
 
         self.unit_temperature_equality = Constraint(
-            self.flowsheet().time,
+            time,
             rule=rule_temperature_balance,
             doc="Unit level temperature equality",
         )
@@ -716,21 +788,7 @@ see reaction package for documentation.}""",
             self.config.has_pressure_change is True
             and self.config.momentum_balance_type != MomentumBalanceType.none
         ):
-            self.deltaP = Reference(self.liquid_phase.deltaP[:])
-
-            # Pressure balance constraint
-            def rule_pressure_balance(self, t):
-                return (
-                    self.deltaP[t]
-                    == self.vapor_outlet.pressure[t]
-                    - self.liquid_phase.properties_in[t].pressure
-                )
-
-            self.unit_pressure_balance = Constraint(
-                self.flowsheet().time,
-                rule=rule_pressure_balance,
-                doc="Unit level pressure balance",
-            )
+            self._build_pressure_balance(time)
 
         # Unit level energy balance
         # Energy leaving in vapor phase must be equal and opposite to enthalpy
@@ -751,7 +809,7 @@ see reaction package for documentation.}""",
             )
 
         self.unit_enthalpy_balance = Constraint(
-            self.flowsheet().time,
+            time,
             rule=rule_energy_balance,
             doc="Unit level enthalpy_balance",
         )
@@ -760,14 +818,12 @@ see reaction package for documentation.}""",
         def rule_electricity_consumption(self, t):
             return self.electricity_consumption[t] == (
                 self.energy_electric_flow_vol_inlet
-                * pyunits.convert(
-                    self.liquid_phase.properties_in[t].flow_vol,
-                    to_units=pyunits.m**3 / pyunits.hr,
-                )
+                * flow_vol_to_m3_hr
+                * self.liquid_phase.properties_in[t].flow_vol
             )
 
         self.unit_electricity_consumption = Constraint(
-            self.flowsheet().time,
+            time,
             rule=rule_electricity_consumption,
             doc="Unit level electricity consumption",
         )
@@ -775,18 +831,44 @@ see reaction package for documentation.}""",
         # Set references to balance terms at unit level
         self.heat_duty = Reference(self.liquid_phase.heat[:])
 
-        iscale.set_scaling_factor(self.volume_AD, 1e-2)
-        iscale.set_scaling_factor(self.volume_vapor, 1e-2)
-        iscale.set_scaling_factor(self.liquid_phase.rate_reaction_generation, 1e4)
-        iscale.set_scaling_factor(self.liquid_phase.mass_transfer_term, 1e2)
-        iscale.set_scaling_factor(self.liquid_phase.heat, 1e-2)
-        iscale.set_scaling_factor(self.liquid_phase.rate_reaction_extent, 1e2)
-        iscale.set_scaling_factor(self.liquid_phase.enthalpy_transfer, 1e-4)
-        iscale.set_scaling_factor(self.liquid_phase.volume, 1e-2)
-        iscale.set_scaling_factor(self.KH_co2, 1e2)
-        iscale.set_scaling_factor(self.KH_ch4, 1e3)
-        iscale.set_scaling_factor(self.KH_h2, 1e4)
-        iscale.set_scaling_factor(self.electricity_consumption, 1e0)
+        # apply the build-time scaling factors in a single pass over a
+        # prebuilt component-to-factor map
+        for comp, sf in (
+            (self.volume_vapor, 1e-2),
+            (self.liquid_phase.rate_reaction_generation, 1e4),
+            (self.liquid_phase.mass_transfer_term, 1e2),
+            (self.liquid_phase.heat, 1e-2),
+            (self.liquid_phase.rate_reaction_extent, 1e2),
+            (self.liquid_phase.enthalpy_transfer, 1e-4),
+            (self.liquid_phase.volume, 1e-2),
+            (self.electricity_consumption, 1e0),
+        ):
+            iscale.set_scaling_factor(comp, sf)
+        KH_sf = {"S_co2": 1e2, "S_ch4": 1e3, "S_h2": 1e4}
+        for (t, j), v in self.KH.items():
+            iscale.set_scaling_factor(v, KH_sf[j])
+
+    def _build_pressure_balance(self, time):
+        """
+        Construct the deltaP reference and unit level pressure balance.
+        Only called when the configuration requests pressure change, so
+        the default path allocates none of these components.
+        """
+        self.deltaP = Reference(self.liquid_phase.deltaP[:])
+
+        # Pressure balance constraint
+        def rule_pressure_balance(self, t):
+            return (
+                self.liquid_phase.deltaP[t]
+                == self.vapor_outlet.pressure[t]
+                - self.liquid_phase.properties_in[t].pressure
+            )
+
+        self.unit_pressure_balance = Constraint(
+            time,
+            rule=rule_pressure_balance,
+            doc="Unit level pressure balance",
+        )
 
     def _get_stream_table_contents(self, time_point=0):
         return create_stream_table_dataframe(
@@ -800,21 +882,19 @@ see reaction package for documentation.}""",
 
     def _get_performance_contents(self, time_point=0):
         # TODO: add aggregated quantities/key metrics
-        var_dict = {"Volume": self.volume_AD[time_point]}
+        var_dict = {}
         if hasattr(self, "heat_duty"):
             var_dict["Heat Duty"] = self.heat_duty[time_point]
         if hasattr(self, "deltaP"):
             var_dict["Pressure Change"] = self.deltaP[time_point]
+        expr_dict = {"Volume": self.volume_AD[time_point]}
 
-        return {"vars": var_dict}
+        return {"vars": var_dict, "exprs": expr_dict}
 
     def calculate_scaling_factors(self):
         super().calculate_scaling_factors()
 
-        common_comps = (
-            self.vapor_phase.component_list
-            & self.liquid_phase.properties_out.component_list
-        )
+        common_comps = self._common_comps
 
         # TODO: improve this later; for now, this resolved some scaling issues for modified adm1 test file
         if "S_IP" in self.config.liquid_property_package.component_list:
@@ -826,83 +906,119 @@ see reaction package for documentation.}""",
                 self.liquid_phase.properties_out[0].conc_mass_comp["S_IN"], 1e-5
             )
 
-        for t, v in self.flow_vol_vap.items():
-            iscale.constraint_scaling_transform(
-                v,
-                iscale.get_scaling_factor(
-                    self.liquid_phase.properties_out[t].flow_vol,
-                    default=1,
-                    warning=True,
-                ),
-            )
-
-        for (t, j), v in self.unit_material_balance.items():
-            if j in common_comps:
-                iscale.constraint_scaling_transform(
-                    v,
-                    iscale.get_scaling_factor(
-                        self.liquid_phase.mass_transfer_term[t, "Liq", j],
-                        default=1,
-                        warning=True,
-                    ),
+        # Bind the scaling helpers and control-volume members to locals -
+        # the loop below is pure attribute-lookup overhead otherwise
+        gsf = iscale.get_scaling_factor
+        cst = iscale.constraint_scaling_transform
+        props_out = self.liquid_phase.properties_out
+        mass_xfer = self.liquid_phase.mass_transfer_term
+        enth_xfer = self.liquid_phase.enthalpy_transfer
+
+        # Collect variables missing a scaling factor and warn once at the
+        # end, instead of paying per-variable warning formatting inside
+        # the loop (the common case on a freshly built model)
+        missing_sf = []
+
+        def sf_or_default(var):
+            sf = gsf(var, warning=False)
+            if sf is None:
+                missing_sf.append(var.name)
+                return 1
+            return sf
+
+        # All of the unit-level constraints are indexed by time (the material
+        # balance additionally by component), so make a single pass over the
+        # time index, fetching each outlet property block once.
+        for t in self.flowsheet().time:
+            props_t = props_out[t]
+
+            cst(self.flow_vol_vap[t], sf_or_default(props_t.flow_vol))
+
+            # only the common (transferring) components need scaling; the
+            # liquid-only balances are left alone
+            for j in common_comps:
+                cst(
+                    self.unit_material_balance[t, j],
+                    sf_or_default(mass_xfer[t, "Liq", j]),
                 )
-            else:
-                pass  # no need to scale this constraint
-
-        for t, v in self.unit_temperature_equality.items():
-            iscale.constraint_scaling_transform(
-                v,
-                iscale.get_scaling_factor(
-                    self.liquid_phase.properties_out[t].temperature,
-                    default=1,
-                    warning=True,
-                ),
-            )
 
-        for t, v in self.unit_enthalpy_balance.items():
-            iscale.constraint_scaling_transform(
-                v,
-                iscale.get_scaling_factor(
-                    self.liquid_phase.enthalpy_transfer[t], default=1, warning=True
-                ),
-            )
+            cst(self.unit_temperature_equality[t], sf_or_default(props_t.temperature))
 
-        for t, v in self.outlet_P.items():
-            iscale.constraint_scaling_transform(
-                v,
-                iscale.get_scaling_factor(
-                    self.liquid_phase.properties_out[t].pressure,
-                    default=1,
-                    warning=True,
-                ),
-            )
-        for t, v in self.Sh2_conc.items():
-            iscale.constraint_scaling_transform(
-                v,
-                iscale.get_scaling_factor(
-                    self.liquid_phase.properties_out[t].conc_mass_comp["S_h2"],
-                    default=1,
-                    warning=True,
-                ),
-            )
-        for t, v in self.Sch4_conc.items():
-            iscale.constraint_scaling_transform(
-                v,
-                iscale.get_scaling_factor(
-                    self.liquid_phase.properties_out[t].conc_mass_comp["S_ch4"],
-                    default=1,
-                    warning=True,
-                ),
+            cst(self.unit_enthalpy_balance[t], sf_or_default(enth_xfer[t]))
+
+            cst(self.outlet_P[t], sf_or_default(props_t.pressure))
+
+            conc_mass = props_t.conc_mass_comp
+            cst(self.Sh2_conc[t], sf_or_default(conc_mass["S_h2"]))
+
+            # Sch4_conc and Sco2_conc are both scaled by the S_ch4
+            # concentration, so look the factor up once
+            sf_sch4 = sf_or_default(conc_mass["S_ch4"])
+            cst(self.Sch4_conc[t], sf_sch4)
+            cst(self.Sco2_conc[t], sf_sch4)
+
+        if missing_sf:
+            _log.warning(
+                f"{self.name}: missing scaling factors, using default of 1 "
+                f"for: {', '.join(missing_sf)}"
             )
-        for t, v in self.Sco2_conc.items():
-            iscale.constraint_scaling_transform(
-                v,
-                iscale.get_scaling_factor(
-                    self.liquid_phase.properties_out[t].conc_mass_comp["S_ch4"],
-                    default=1,
-                    warning=True,
-                ),
+
+    def _default_vapor_state_args(self, t_init, vap_state_vars):
+        """
+        Build default vapor phase initialization arguments from the current
+        liquid phase outlet state.
+
+        The defaults are derived from the live values of the liquid state
+        block, so they are recomputed on each call rather than cached.
+        """
+        vapor_state_args = {}
+        liq_state = self.liquid_phase.properties_out[t_init]
+
+        # Classify the state variables by name once, then build the
+        # arguments with the liquid state attribute resolved a single
+        # time per variable
+        classifier = {
+            sv: (
+                "flow"
+                if "flow" in sv
+                else "conc"
+                if "conc" in sv
+                else "pressure"
+                if "pressure" in sv
+                else "other"
             )
+            for sv in vap_state_vars
+        }
+        liq_comps = set(liq_state.component_list)
+
+        def _val(obj):
+            # plain Vars can be read directly, skipping value()'s generic
+            # dispatch; anything else (e.g. an Expression) needs value()
+            return obj.value if obj.is_variable_type() else value(obj)
+
+        for sv, kind in classifier.items():
+            liq_attr = getattr(liq_state, sv)
+            if kind == "flow":
+                vapor_state_args[sv] = 13 * _val(liq_attr)
+            elif kind == "conc":
+                # Concentration is indexed by component
+                is_var = liq_attr.is_variable_type()
+                vapor_state_args[sv] = {
+                    j: (
+                        1e3 * (liq_attr[j].value if is_var else value(liq_attr[j]))
+                        if j in liq_comps
+                        else 0.5
+                    )
+                    for j in vap_state_vars[sv]
+                }
+
+            elif kind == "pressure":
+                vapor_state_args[sv] = 1.05 * _val(liq_attr)
+
+            else:
+                vapor_state_args[sv] = _val(liq_attr)
+
+        return vapor_state_args
 
     # TO DO: fix initialization
     def initialize_build(
@@ -938,10 +1054,11 @@ see reaction package for documentation.}""",
             optarg = {}
 
         # Check DOF
-        if degrees_of_freedom(self) != 0:
+        dof = degrees_of_freedom(self)
+        if dof != 0:
             raise InitializationError(
                 f"{self.name} degrees of freedom were not 0 at the beginning "
-                f"of initialization. DoF = {degrees_of_freedom(self)}"
+                f"of initialization. DoF = {dof}"
             )
 
         # Set solver options
@@ -963,33 +1080,16 @@ see reaction package for documentation.}""",
         init_log.info_high("Initialization Step 1 Complete.")
         # ---------------------------------------------------------------------
         # Initialize vapor phase state block
+        t_init = self.flowsheet().time.first()
+        vap_state_vars = self.vapor_phase[t_init].define_state_vars()
         if vapor_state_args is None:
-            t_init = self.flowsheet().time.first()
-            vapor_state_args = {}
-            vap_state_vars = self.vapor_phase[t_init].define_state_vars()
-
-            liq_state = self.liquid_phase.properties_out[t_init]
-
-            # Check for unindexed state variables
-            for sv in vap_state_vars:
-                if "flow" in sv:
-                    vapor_state_args[sv] = 13 * value(getattr(liq_state, sv))
-                elif "conc" in sv:
-                    # Flow is indexed by component
-                    vapor_state_args[sv] = {}
-                    for j in vap_state_vars[sv]:
-                        if j in liq_state.component_list:
-                            vapor_state_args[sv][j] = 1e3 * value(
-                                getattr(liq_state, sv)[j]
-                            )
-                        else:
-                            vapor_state_args[sv][j] = 0.5
-
-                elif "pressure" in sv:
-                    vapor_state_args[sv] = 1.05 * value(getattr(liq_state, sv))
-
-                else:
-                    vapor_state_args[sv] = value(getattr(liq_state, sv))
+            vapor_state_args = self._default_vapor_state_args(t_init, vap_state_vars)
+        elif any(sv not in vapor_state_args for sv in vap_state_vars):
+            # fill in any state variables the caller did not supply, so a
+            # partial dict does not silently under-initialize the vapor phase
+            defaults = self._default_vapor_state_args(t_init, vap_state_vars)
+            for sv, val in defaults.items():
+                vapor_state_args.setdefault(sv, val)
 
         self.vapor_phase.initialize(
             outlvl=outlvl,
@@ -1005,11 +1105,13 @@ see reaction package for documentation.}""",
         # # Solve unit model
         with idaeslog.solver_log(solve_log, idaeslog.DEBUG) as slc:
             results = solverobj.solve(self, tee=slc.tee)
-            if not check_optimal_termination(results):
+            solve_ok = check_optimal_termination(results)
+            if not solve_ok:
                 init_log.warning(
                     f"Trouble solving unit model {self.name}, trying one more time"
                 )
                 results = solverobj.solve(self, tee=slc.tee)
+                solve_ok = check_optimal_termination(results)
         init_log.info_high(
             "Initialization Step 3 {}.".format(idaeslog.condition(results))
         )
@@ -1018,7 +1120,7 @@ see reaction package for documentation.}""",
         # Release Inlet state
         self.liquid_phase.release_state(flags, outlvl)
 
-        if not check_optimal_termination(results):
+        if not solve_ok:
             raise InitializationError(
                 f"{self.name} failed to initialize successfully. Please check "
                 f"the output logs for more information."
@@ -20,6 +20,8 @@ Department of Industrial Electrical Engineering and Automation, Lund University,
 
 """
 
+import math
+
 import pytest
 from pyomo.environ import (
     ConcreteModel,
@@ -50,6 +52,7 @@ from idaes.core.util.scaling import (
     unscaled_variables_generator,
 )
 
+from idaes.core.util.constants import Constants
 from idaes.core.util.testing import initialization_tester
 
 from watertap.unit_models.anaerobic_digestor import AD
@@ -88,7 +91,8 @@ def test_config():
         reaction_package=m.fs.rxn_props,
     )
 
-    assert len(m.fs.unit.config) == 16
+    assert len(m.fs.unit.config) == 17
+    assert not m.fs.unit.config.henry_linearize
 
     assert not m.fs.unit.config.dynamic
     assert not m.fs.unit.config.has_holdup
@@ -106,6 +110,46 @@ def test_config():
     assert m.fs.unit.config.reaction_package is m.fs.rxn_props
 
 
+@pytest.mark.unit
+def test_henry_linearize():
+    m = ConcreteModel()
+
+    m.fs = FlowsheetBlock(dynamic=False)
+
+    m.fs.props = ADM1ParameterBlock()
+    m.fs.props_vap = ADM1_vaporParameterBlock()
+    m.fs.rxn_props = ADM1ReactionParameterBlock(property_package=m.fs.props)
+
+    m.fs.unit = AD(
+        liquid_property_package=m.fs.props,
+        vapor_property_package=m.fs.props_vap,
+        reaction_package=m.fs.rxn_props,
+        henry_linearize=True,
+    )
+
+    assert m.fs.unit.config.henry_linearize
+    assert_units_consistent(m.fs.unit.Henrys_law)
+
+    m.fs.unit.vapor_phase[0].temperature.set_value(308.15)
+
+    T = value(m.fs.unit.vapor_phase[0].temperature)
+    T_ref = value(m.fs.props_vap.temperature_ref)
+    R = value(Constants.gas_constant)
+
+    for j in m.fs.unit.henry_components:
+        x = -value(m.fs.unit.KH_E[j]) / R * (1 / T_ref - 1 / T)
+        # the constraint is KH[t, j] == KH_A[j] * f(x), so its body
+        # evaluates to KH[t, j] minus the temperature correlation
+        rhs = value(m.fs.unit.KH[0, j]) - value(m.fs.unit.Henrys_law[0, j].body)
+        # matches the second-order Taylor expansion of the Arrhenius
+        # exponential exactly...
+        taylor = value(m.fs.unit.KH_A[j]) * (1 + x + 0.5 * x**2)
+        assert pytest.approx(taylor, rel=1e-12) == rhs
+        # ...and the exact exponential only approximately
+        exact = value(m.fs.unit.KH_A[j]) * math.exp(x)
+        assert pytest.approx(exact, rel=1e-2) == rhs
+
+
 # -----------------------------------------------------------------------------
 class TestAdm(object):
     @pytest.fixture(scope="class")
@@ -199,9 +243,11 @@ class TestAdm(object):
         assert hasattr(adm.fs.unit, "volume_vapor")
         assert hasattr(adm.fs.unit, "heat_duty")
 
-        assert number_variables(adm) == 266
-        assert number_total_constraints(adm) == 150
-        assert number_unused_variables(adm) == 0
+        assert number_variables(adm) == 265
+        assert number_total_constraints(adm) == 149
+        # volume_vapor is a design specification that now only feeds the
+        # volume_AD Expression
+        assert number_unused_variables(adm) == 1
 
     @pytest.mark.component
     def test_units(self, adm):
@@ -272,9 +318,9 @@ class TestAdm(object):
         assert pytest.approx(0.174485, abs=1e-2) == value(
             adm.fs.unit.vapor_outlet.conc_mass_comp[0, "S_co2"]
         )
-        assert pytest.approx(0.0271, abs=1e-2) == value(adm.fs.unit.KH_co2[0])
-        assert pytest.approx(0.00116, abs=1e-2) == value(adm.fs.unit.KH_ch4[0])
-        assert pytest.approx(7.8e-4, abs=1e-2) == value(adm.fs.unit.KH_h2[0])
+        assert pytest.approx(0.0271, abs=1e-2) == value(adm.fs.unit.KH[0, "S_co2"])
+        assert pytest.approx(0.00116, abs=1e-2) == value(adm.fs.unit.KH[0, "S_ch4"])
+        assert pytest.approx(7.8e-4, abs=1e-2) == value(adm.fs.unit.KH[0, "S_h2"])
         assert pytest.approx(0.2054, rel=1e-2) == value(
             adm.fs.unit.electricity_consumption[0]
         )
@@ -352,9 +398,11 @@ class TestAdm(object):
 
         assert perf_dict == {
             "vars": {
-                "Volume": adm.fs.unit.volume_AD[0],
                 "Heat Duty": adm.fs.unit.heat_duty[0],
-            }
+            },
+            "exprs": {
+                "Volume": adm.fs.unit.volume_AD[0],
+            },
         }
 
     @pytest.mark.unit